@@ -15,6 +15,12 @@ import yaml
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 class PatternDetector:
     """Applies detection patterns to project structure."""
 
@@ -26,8 +32,19 @@ class PatternDetector:
             raise FileNotFoundError(f"Patterns file not found: {self.patterns_file}")
 
         with open(self.patterns_file, 'r', encoding='utf-8') as f:
-            self.config = yaml.safe_load(f)
-
+            self._configure(yaml.load(f, Loader=SafeLoader))
+
+    @classmethod
+    def from_dict(cls, config: Dict) -> 'PatternDetector':
+        """Create detector from an already-parsed patterns configuration."""
+        detector = cls.__new__(cls)
+        detector.patterns_file = None
+        detector._configure(config)
+        return detector
+
+    def _configure(self, config: Dict):
+        """Apply parsed patterns configuration."""
+        self.config = config
         self.patterns = self.config.get('patterns', [])
         self.scoring = self.config.get('scoring', {})
         self.severity = self.config.get('severity', {})
@@ -19,15 +19,18 @@ from datetime import datetime
 class MemoryIntegration:
     """Handles local-memory integration with isolation enforcement."""
 
-    def __init__(self, session_id: Optional[str] = None):
+    def __init__(self, session_id: Optional[str] = None, debug: bool = False):
         """
         Initialize memory integration.
 
         Args:
             session_id: Optional session ID. If not provided, attempts to read
                        from .claude/project-session-id file.
+            debug: If True, params also carry the unserialized content dict
+                   under '_content_dict' (for tests; never store these params).
         """
         self.session_id = session_id or self._get_project_session_id()
+        self.debug = debug
 
         if not self.session_id:
             raise ValueError(
@@ -84,6 +87,9 @@ class MemoryIntegration:
             'session_id': self.session_id,
         }
 
+        if self.debug:
+            params['_content_dict'] = dict(content)
+
         return params
 
     def ensure_isolation(self, params: Dict) -> None:
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Shared pytest configuration for Project Catalyst tests
+
+Slow tests (marked with @pytest.mark.slow) are skipped by default.
+Run them with: pytest --runslow
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# Make the analyzer scripts importable by name (e.g. `import memory_integration`)
+ANALYZER_SCRIPTS_DIR = Path(__file__).resolve().parents[1] / 'skills' / 'project-analyzer' / 'scripts'
+if str(ANALYZER_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(ANALYZER_SCRIPTS_DIR))
+
+
+def load_script_module(name: str, filename: str, register: bool = False):
+    """
+    Load a module from the analyzer scripts directory (hyphenated filenames).
+
+    With register=True the module is added to sys.modules (once), so a plain
+    `import name` works afterwards.
+    """
+    if register and name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(name, ANALYZER_SCRIPTS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    if register:
+        sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# Hyphenated scripts the tests import by module name
+load_script_module('analyze_structure', 'analyze-structure.py', register=True)
+load_script_module('detect_patterns', 'detect-patterns.py', register=True)
+
+
+@pytest.fixture(scope='session')
+def analyzer_scripts_dir() -> Path:
+    """Directory holding the project-analyzer skill scripts."""
+    return ANALYZER_SCRIPTS_DIR
+
+
+def pytest_addoption(parser):
+    """Register command line options."""
+    parser.addoption(
+        '--runslow',
+        action='store_true',
+        default=False,
+        help='run tests marked as slow'
+    )
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line('markers', 'slow: mark test as slow to run (enable with --runslow)')
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --runslow is given."""
+    if config.getoption('--runslow'):
+        return
+
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
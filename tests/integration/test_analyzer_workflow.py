@@ -17,8 +17,9 @@ from pathlib import Path
 import pytest
 
 # Add scripts directory to path
-SCRIPTS_DIR = Path(__file__).parent.parent.parent / 'skills' / 'project-analyzer' / 'scripts'
-ASSETS_DIR = Path(__file__).parent.parent.parent / 'skills' / 'project-analyzer' / 'assets'
+ANALYZER_DIR = Path(__file__).resolve().parents[2] / 'skills' / 'project-analyzer'
+SCRIPTS_DIR = ANALYZER_DIR / 'scripts'
+ASSETS_DIR = ANALYZER_DIR / 'assets'
 
 sys.path.insert(0, str(SCRIPTS_DIR))
 
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for Project Catalyst unit tests
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable
+
+import pytest
+
+# Registered in sys.modules by tests/conftest.py (the script name has a hyphen)
+import analyze_structure
+
+
+def make_project(base: Path, files: Dict[str, str] = None,
+                 directories: Iterable[str] = ()) -> Path:
+    """Populate a project directory with the given files and directories."""
+    for directory in directories:
+        (base / directory).mkdir(parents=True, exist_ok=True)
+
+    for name, content in (files or {}).items():
+        (base / name).write_text(content)
+
+    return base
+
+
+@pytest.fixture(scope='session')
+def ProjectAnalyzer():
+    """ProjectAnalyzer class from analyze-structure.py."""
+    return analyze_structure.ProjectAnalyzer
+
+
+# Project scenarios are built once per session and must be treated as read-only
+
+@pytest.fixture(scope='session')
+def empty_project_dir(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp('empty')
+
+
+@pytest.fixture(scope='session')
+def node_project_dir(tmp_path_factory) -> Path:
+    return make_project(tmp_path_factory.mktemp('node'),
+                        files={'README.md': '# Test Project', 'package.json': '{}'})
+
+
+@pytest.fixture(scope='session')
+def python_project_dir(tmp_path_factory) -> Path:
+    return make_project(tmp_path_factory.mktemp('python'),
+                        files={'requirements.txt': 'PyYAML>=6.0.1'})
+
+
+@pytest.fixture(scope='session')
+def git_project_dir(tmp_path_factory) -> Path:
+    return make_project(tmp_path_factory.mktemp('git'), directories=['.git'])
+
+
+@pytest.fixture(scope='session')
+def skip_patterns_project_dir(tmp_path_factory) -> Path:
+    return make_project(tmp_path_factory.mktemp('skip'),
+                        directories=['node_modules', '__pycache__', '.git', 'src'])
+
+
+@pytest.fixture(scope='session')
+def react_project_dir(tmp_path_factory) -> Path:
+    return make_project(tmp_path_factory.mktemp('react'),
+                        files={'package.json': '{"dependencies": {"react": "^18.0.0"}}'})
+
+
+@pytest.fixture(scope='session')
+def django_project_dir(tmp_path_factory) -> Path:
+    return make_project(tmp_path_factory.mktemp('django'),
+                        files={'requirements.txt': 'Django>=4.0.0'})
+
+
+@pytest.fixture(scope='session')
+def ci_github_project_dir(tmp_path_factory) -> Path:
+    return make_project(tmp_path_factory.mktemp('ci_github'),
+                        files={'.github/workflows/ci.yml': 'name: CI'},
+                        directories=['.github/workflows'])
+
+
+@pytest.fixture(scope='session')
+def tests_project_dir(tmp_path_factory) -> Path:
+    return make_project(tmp_path_factory.mktemp('with_tests'), directories=['tests'])
+
+
+@pytest.fixture(scope='session')
+def python_git_project_dir(tmp_path_factory) -> Path:
+    return make_project(tmp_path_factory.mktemp('python_git'),
+                        files={'requirements.txt': 'PyYAML>=6.0.1', 'README.md': '# Test'},
+                        directories=['.git'])
@@ -1,269 +1,264 @@
 #!/usr/bin/env python3
 """
 Unit tests for detect-patterns.py
+
+The patterns fixture is written with libyaml's CSafeDumper when available,
+so the tests also exercise PatternDetector's C loader path.
 """
 
-import sys
+import copy
 import yaml
-import tempfile
+from functools import lru_cache
 from pathlib import Path
 
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'skills' / 'project-analyzer' / 'scripts'))
-
-# Import with the correct module name (using hyphen-to-underscore conversion)
-import importlib.util
-spec = importlib.util.spec_from_file_location(
-    "detect_patterns",
-    Path(__file__).parent.parent.parent / 'skills' / 'project-analyzer' / 'scripts' / 'detect-patterns.py'
-)
-detect_patterns = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(detect_patterns)
+import pytest
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    # PyYAML built without libyaml
+    from yaml import SafeDumper
+
+
+# Registered in sys.modules by tests/conftest.py (the script name has a hyphen)
+import detect_patterns
 PatternDetector = detect_patterns.PatternDetector
 
 
-def create_test_patterns_yaml():
-    """Create a temporary patterns YAML file for testing."""
-    patterns = {
-        'patterns': [
-            {
-                'id': 'test-missing-readme',
-                'type': 'file_absence',
-                'check': 'README.md',
-                'confidence': 'high',
-                'severity': 'high',
-                'recommendation': {
-                    'template': 'documentation/README',
-                    'reason': 'Test reason'
-                }
-            },
-            {
-                'id': 'test-missing-gitignore',
-                'type': 'file_absence',
-                'check': '.gitignore',
-                'confidence': 'high',
-                'severity': 'medium',
-                'recommendation': {
-                    'template': 'git/gitignore',
-                    'reason': 'Test reason'
-                }
-            },
-            {
-                'id': 'test-missing-ci',
-                'type': 'directory_absence',
-                'check': ['.github/workflows', '.gitlab-ci.yml'],
-                'confidence': 'high',
-                'severity': 'high',
-                'recommendation': {
-                    'template': 'ci-cd/github-actions',
-                    'reason': 'Test reason'
-                }
+# Detection patterns shared by every test in this module
+TEST_PATTERNS = {
+    'patterns': [
+        {
+            'id': 'test-missing-readme',
+            'type': 'file_absence',
+            'check': 'README.md',
+            'confidence': 'high',
+            'severity': 'high',
+            'recommendation': {
+                'template': 'documentation/README',
+                'reason': 'Test reason'
             }
-        ],
-        'scoring': {
-            'high': {'weight': 1.0},
-            'medium': {'weight': 0.7},
-            'low': {'weight': 0.4}
         },
-        'severity': {
-            'high': {'priority': 1},
-            'medium': {'priority': 2},
-            'low': {'priority': 3}
+        {
+            'id': 'test-missing-gitignore',
+            'type': 'file_absence',
+            'check': '.gitignore',
+            'confidence': 'high',
+            'severity': 'medium',
+            'recommendation': {
+                'template': 'git/gitignore',
+                'reason': 'Test reason'
+            }
+        },
+        {
+            'id': 'test-missing-ci',
+            'type': 'directory_absence',
+            'check': ['.github/workflows', '.gitlab-ci.yml'],
+            'confidence': 'high',
+            'severity': 'high',
+            'recommendation': {
+                'template': 'ci-cd/github-actions',
+                'reason': 'Test reason'
+            }
         }
+    ],
+    'scoring': {
+        'high': {'weight': 1.0},
+        'medium': {'weight': 0.7},
+        'low': {'weight': 0.4}
+    },
+    'severity': {
+        'high': {'priority': 1},
+        'medium': {'priority': 2},
+        'low': {'priority': 3}
     }
+}
+
+# Serialized once at import; fixtures only write the bytes
+TEST_PATTERNS_YAML = yaml.dump(TEST_PATTERNS, Dumper=SafeDumper).encode('utf-8')
+
+
+@pytest.fixture(scope='module')
+def patterns_file(tmp_path_factory) -> Path:
+    """Patterns YAML written once per module."""
+    path = tmp_path_factory.mktemp('patterns') / 'patterns.yaml'
+    path.write_bytes(TEST_PATTERNS_YAML)
+    return path
+
+
+@pytest.fixture(scope='module')
+def detector():
+    """PatternDetector shared across tests; detect() does not mutate it."""
+    return PatternDetector.from_dict(TEST_PATTERNS)
+
+
+def _freeze(value):
+    """Convert nested dicts/lists into a hashable form that _thaw() reverses."""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((key, _freeze(item)) for key, item in value.items())))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    return value
+
+
+def _thaw(value):
+    """Rebuild the dicts/lists frozen by _freeze()."""
+    if isinstance(value, tuple) and len(value) == 2 and value[0] in (dict, list):
+        kind, items = value
+        if kind is dict:
+            return {key: _thaw(item) for key, item in items}
+        return [_thaw(item) for item in items]
+    return value
+
 
-    tmpfile = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
-    yaml.dump(patterns, tmpfile)
-    tmpfile.close()
-    return tmpfile.name
+@pytest.fixture(scope='module')
+def cached_detect(detector):
+    """detector.detect() memoized on the frozen project structure; detect() is pure."""
+    @lru_cache(maxsize=None)
+    def run(frozen_structure):
+        return detector.detect(_thaw(frozen_structure))
+    return run
 
 
-def test_pattern_detector_initialization():
-    """Test PatternDetector initialization."""
-    patterns_file = create_test_patterns_yaml()
+@pytest.fixture
+def detect(cached_detect):
+    """detector.detect() with an added 'detections_by_id' lookup.
 
-    try:
-        detector = PatternDetector(patterns_file)
-        assert len(detector.patterns) == 3
-        assert detector.patterns[0]['id'] == 'test-missing-readme'
-    finally:
-        Path(patterns_file).unlink()
+    Each call gets its own copy; the memoized results are never mutated.
+    """
+    def run(project_structure):
+        results = copy.deepcopy(cached_detect(_freeze(project_structure)))
+        results['detections_by_id'] = {d['id']: d for d in results['detections']}
+        return results
+    return run
 
 
-def test_detect_missing_readme():
+def test_pattern_detector_initialization(patterns_file):
+    """Test PatternDetector initialization from a YAML file."""
+    detector = PatternDetector(str(patterns_file))
+    assert len(detector.patterns) == 3
+    assert detector.patterns[0]['id'] == 'test-missing-readme'
+
+
+def test_detect_missing_readme(detect):
     """Test detection of missing README.md."""
-    patterns_file = create_test_patterns_yaml()
-
-    try:
-        detector = PatternDetector(patterns_file)
-
-        # Project structure without README
-        project_structure = {
-            'project_name': 'test-project',
-            'project_types': [],
-            'frameworks': [],
-            'files': ['.gitignore', 'package.json'],
-            'directories': []
-        }
+    # Project structure without README
+    project_structure = {
+        'project_name': 'test-project',
+        'project_types': [],
+        'frameworks': [],
+        'files': ['.gitignore', 'package.json'],
+        'directories': []
+    }
 
-        results = detector.detect(project_structure)
+    results = detect(project_structure)
 
-        # Should detect missing README
-        readme_detection = next(
-            (d for d in results['detections'] if d['id'] == 'test-missing-readme'),
-            None
-        )
-        assert readme_detection is not None
-        assert readme_detection['issue_found'] == True
-        assert readme_detection['severity'] == 'high'
-    finally:
-        Path(patterns_file).unlink()
+    # Should detect missing README
+    readme_detection = results['detections_by_id']['test-missing-readme']
+    assert readme_detection['issue_found'] == True
+    assert readme_detection['severity'] == 'high'
 
 
-def test_detect_existing_readme():
+def test_detect_existing_readme(detect):
     """Test that existing README is not flagged."""
-    patterns_file = create_test_patterns_yaml()
-
-    try:
-        detector = PatternDetector(patterns_file)
-
-        # Project structure WITH README
-        project_structure = {
-            'project_name': 'test-project',
-            'project_types': [],
-            'frameworks': [],
-            'files': ['README.md', '.gitignore', 'package.json'],
-            'directories': []
-        }
+    # Project structure WITH README
+    project_structure = {
+        'project_name': 'test-project',
+        'project_types': [],
+        'frameworks': [],
+        'files': ['README.md', '.gitignore', 'package.json'],
+        'directories': []
+    }
 
-        results = detector.detect(project_structure)
+    results = detect(project_structure)
 
-        # Should NOT detect missing README
-        readme_detection = next(
-            (d for d in results['detections'] if d['id'] == 'test-missing-readme'),
-            None
-        )
-        assert readme_detection is not None
-        assert readme_detection['issue_found'] == False
-    finally:
-        Path(patterns_file).unlink()
+    # Should NOT detect missing README
+    readme_detection = results['detections_by_id']['test-missing-readme']
+    assert readme_detection['issue_found'] == False
 
 
-def test_detect_missing_ci_directory():
+def test_detect_missing_ci_directory(detect):
     """Test detection of missing CI/CD configuration."""
-    patterns_file = create_test_patterns_yaml()
-
-    try:
-        detector = PatternDetector(patterns_file)
-
-        # Project structure without CI
-        project_structure = {
-            'project_name': 'test-project',
-            'project_types': [],
-            'frameworks': [],
-            'files': ['README.md'],
-            'directories': ['src', 'tests']
-        }
+    # Project structure without CI
+    project_structure = {
+        'project_name': 'test-project',
+        'project_types': [],
+        'frameworks': [],
+        'files': ['README.md'],
+        'directories': ['src', 'tests']
+    }
 
-        results = detector.detect(project_structure)
+    results = detect(project_structure)
 
-        # Should detect missing CI
-        ci_detection = next(
-            (d for d in results['detections'] if d['id'] == 'test-missing-ci'),
-            None
-        )
-        assert ci_detection is not None
-        assert ci_detection['issue_found'] == True
-    finally:
-        Path(patterns_file).unlink()
+    # Should detect missing CI
+    ci_detection = results['detections_by_id']['test-missing-ci']
+    assert ci_detection['issue_found'] == True
 
 
-def test_recommendation_generation():
+def test_recommendation_generation(detect):
     """Test that recommendations are generated correctly."""
-    patterns_file = create_test_patterns_yaml()
-
-    try:
-        detector = PatternDetector(patterns_file)
-
-        # Project missing README and .gitignore
-        project_structure = {
-            'project_name': 'test-project',
-            'project_types': [],
-            'frameworks': [],
-            'files': ['package.json'],
-            'directories': []
-        }
+    # Project missing README and .gitignore
+    project_structure = {
+        'project_name': 'test-project',
+        'project_types': [],
+        'frameworks': [],
+        'files': ['package.json'],
+        'directories': []
+    }
 
-        results = detector.detect(project_structure)
+    results = detect(project_structure)
 
-        # Should have 2 recommendations
-        assert len(results['recommendations']) == 3  # README, gitignore, CI
+    # Should have 2 recommendations
+    assert len(results['recommendations']) == 3  # README, gitignore, CI
 
-        # Check that recommendations are sorted by priority
-        assert results['recommendations'][0]['severity'] == 'high'
-    finally:
-        Path(patterns_file).unlink()
+    # Check that recommendations are sorted by priority
+    assert results['recommendations'][0]['severity'] == 'high'
 
 
-def test_priority_score_calculation():
+def test_priority_score_calculation(detector):
     """Test priority score calculation."""
-    patterns_file = create_test_patterns_yaml()
-
-    try:
-        detector = PatternDetector(patterns_file)
-
-        # Create detection with high severity and high confidence
-        detection = {
-            'confidence': 'high',
-            'severity': 'high'
-        }
+    # Create detection with high severity and high confidence
+    detection = {
+        'confidence': 'high',
+        'severity': 'high'
+    }
 
-        priority = detector._calculate_priority(detection)
+    priority = detector._calculate_priority(detection)
 
-        # High confidence (1.0) × high multiplier (1.0) × high priority (10) = 10.0
-        assert priority == 10.0
+    # High confidence (1.0) × high multiplier (1.0) × high priority (10) = 10.0
+    assert priority == 10.0
 
-        # Create detection with medium severity and medium confidence
-        detection = {
-            'confidence': 'medium',
-            'severity': 'medium'
-        }
+    # Create detection with medium severity and medium confidence
+    detection = {
+        'confidence': 'medium',
+        'severity': 'medium'
+    }
 
-        priority = detector._calculate_priority(detection)
+    priority = detector._calculate_priority(detection)
 
-        # Medium confidence (0.7) × medium multiplier (0.6) × medium priority (5) = 2.1
-        assert priority == 2.1
-    finally:
-        Path(patterns_file).unlink()
+    # Medium confidence (0.7) × medium multiplier (0.6) × medium priority (5) = 2.1
+    assert priority == 2.1
 
 
-def test_summary_statistics():
+def test_summary_statistics(detect):
     """Test that summary statistics are calculated correctly."""
-    patterns_file = create_test_patterns_yaml()
-
-    try:
-        detector = PatternDetector(patterns_file)
-
-        # Project missing README (high severity) and .gitignore (medium severity)
-        project_structure = {
-            'project_name': 'test-project',
-            'project_types': [],
-            'frameworks': [],
-            'files': ['package.json'],
-            'directories': []
-        }
+    # Project missing README (high severity) and .gitignore (medium severity)
+    project_structure = {
+        'project_name': 'test-project',
+        'project_types': [],
+        'frameworks': [],
+        'files': ['package.json'],
+        'directories': []
+    }
 
-        results = detector.detect(project_structure)
-        summary = results['summary']
+    results = detect(project_structure)
+    summary = results['summary']
 
-        assert summary['total_patterns'] == 3
-        assert summary['issues_found'] == 3
-        assert summary['high_severity'] == 2  # README and CI
-        assert summary['medium_severity'] == 1  # .gitignore
-    finally:
-        Path(patterns_file).unlink()
+    assert summary['total_patterns'] == 3
+    assert summary['issues_found'] == 3
+    assert summary['high_severity'] == 2  # README and CI
+    assert summary['medium_severity'] == 1  # .gitignore
 
 
 if __name__ == '__main__':
-    import pytest
     pytest.main([__file__, '-v'])
@@ -3,53 +3,119 @@
 Unit tests for memory_integration.py
 """
 
-import sys
 import json
-import tempfile
-from pathlib import Path
+from collections.abc import Mapping
+from contextlib import nullcontext
+from types import MappingProxyType
+
+import pytest
+from freezegun import freeze_time
+
+# Importable via the scripts path added in tests/conftest.py
+from memory_integration import MemoryIntegration
+
+
+# Shared read-only inputs; tests pass _mutable() copies where the code
+# under test needs plain dicts/lists (e.g. for JSON serialization)
+SAMPLE_CONTENT = MappingProxyType({
+    'timestamp': '2025-11-27',
+    'project_name': 'test-project',
+    'issues_found': 5
+})
+
+SAMPLE_ANALYSIS = MappingProxyType({
+    'detections': (
+        MappingProxyType({'id': 'missing-readme', 'confidence': 'high'}),
+        MappingProxyType({'id': 'missing-gitignore', 'confidence': 'high'}),
+    ),
+    'recommendations': (
+        MappingProxyType({
+            'id': 'missing-readme',
+            'template': 'documentation/README',
+            'severity': 'high'
+        }),
+    ),
+    'summary': MappingProxyType({
+        'issues_found': 2,
+        'high_severity': 1,
+        'medium_severity': 1,
+        'low_severity': 0,
+        'total_patterns': 10
+    }),
+    'project_types': ('python',),
+    'frameworks': ('django',)
+})
+
+
+def _mutable(value):
+    """Deep-copy a read-only constant into plain dicts and lists."""
+    if isinstance(value, Mapping):
+        return {key: _mutable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_mutable(item) for item in value]
+    return value
+
+
+# (summary, expected health score)
+HEALTH_CASES = [
+    # Perfect project (no issues)
+    (MappingProxyType({'total_patterns': 10, 'issues_found': 0,
+                       'high_severity': 0, 'medium_severity': 0, 'low_severity': 0}), 100),
+    # 1 high severity issue: 100 - 10 (1/10*100) - 20 (1*20)
+    (MappingProxyType({'total_patterns': 10, 'issues_found': 1,
+                       'high_severity': 1, 'medium_severity': 0, 'low_severity': 0}), 70),
+    # Multiple issues: 100 - 40 (4/10*100) - 20 (1*20) - 20 (2*10)
+    (MappingProxyType({'total_patterns': 10, 'issues_found': 4,
+                       'high_severity': 1, 'medium_severity': 2, 'low_severity': 1}), 20),
+    # Health score should never go below 0
+    (MappingProxyType({'total_patterns': 10, 'issues_found': 10,
+                       'high_severity': 10, 'medium_severity': 0, 'low_severity': 0}), 0),
+]
+
+# (params, should_raise, expected error message fragment)
+ISOLATION_CASES = [
+    ({'session_filter_mode': 'session_only', 'session_id': 'test-session-123'},
+     False, None),
+    ({'session_filter_mode': 'all', 'session_id': 'test-session-123'},
+     True, 'session_filter_mode must be'),
+    ({'session_filter_mode': 'session_only'},
+     True, 'session_id is required'),
+]
+
+
+@pytest.fixture(scope='module', autouse=True)
+def frozen_time():
+    """Pin datetime.now() so stored timestamps are deterministic."""
+    with freeze_time('2025-11-27'):
+        yield
+
 
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'skills' / 'project-analyzer' / 'scripts'))
+@pytest.fixture(scope='module')
+def integration():
+    """MemoryIntegration with an explicit test session ID.
 
-# Import with the correct module name (using hyphen-to-underscore conversion)
-import importlib.util
-spec = importlib.util.spec_from_file_location(
-    "memory_integration",
-    Path(__file__).parent.parent.parent / 'skills' / 'project-analyzer' / 'scripts' / 'memory_integration.py'
-)
-memory_integration = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(memory_integration)
-MemoryIntegration = memory_integration.MemoryIntegration
+    Shared across the module: tests must not mutate instance state.
+    Debug mode exposes params['_content_dict'] alongside the JSON payload.
+    """
+    return MemoryIntegration(session_id='test-session-123', debug=True)
 
 
-def test_memory_integration_with_session_id():
+def test_memory_integration_with_session_id(integration):
     """Test MemoryIntegration initialization with explicit session ID."""
-    integration = MemoryIntegration(session_id='test-session-123')
     assert integration.session_id == 'test-session-123'
 
 
 def test_memory_integration_without_session_id():
     """Test MemoryIntegration initialization without session ID."""
-    try:
-        integration = MemoryIntegration()
-        # Should raise ValueError if no session ID found
-        assert False, "Should raise ValueError"
-    except ValueError as e:
-        assert 'No session ID' in str(e)
+    # Should raise ValueError if no session ID found
+    with pytest.raises(ValueError, match='No session ID'):
+        MemoryIntegration()
 
 
-def test_create_isolated_params():
+def test_create_isolated_params(integration):
     """Test creation of isolated parameters."""
-    integration = MemoryIntegration(session_id='test-session-123')
-
-    content = {
-        'timestamp': '2025-11-27',
-        'project_name': 'test-project',
-        'issues_found': 5
-    }
-
     params = integration.create_isolated_params(
-        content=content,
+        content=_mutable(SAMPLE_CONTENT),
         tags=['test-tag'],
         importance=8
     )
@@ -61,110 +127,51 @@ def test_create_isolated_params():
     assert params['source'] == 'project-catalyst-analyzer'
     assert params['domain'] == 'project-catalyst'
 
-    # Content should be JSON-serialized
+    # Content should be JSON-serialized; the stored payload matches the debug copy
     assert isinstance(params['content'], str)
-    parsed_content = json.loads(params['content'])
-    assert parsed_content['project_name'] == 'test-project'
-
-
-def test_ensure_isolation_valid():
-    """Test isolation enforcement with valid parameters."""
-    integration = MemoryIntegration(session_id='test-session-123')
-
-    params = {
-        'session_filter_mode': 'session_only',
-        'session_id': 'test-session-123'
-    }
-
-    # Should not raise any exception
-    integration.ensure_isolation(params)
-
-
-def test_ensure_isolation_invalid_mode():
-    """Test isolation enforcement with invalid session_filter_mode."""
-    integration = MemoryIntegration(session_id='test-session-123')
-
-    params = {
-        'session_filter_mode': 'all',  # Invalid!
-        'session_id': 'test-session-123'
-    }
-
-    try:
-        integration.ensure_isolation(params)
-        assert False, "Should raise ValueError"
-    except ValueError as e:
-        assert 'session_filter_mode must be' in str(e)
-
-
-def test_ensure_isolation_missing_session_id():
-    """Test isolation enforcement with missing session_id."""
-    integration = MemoryIntegration(session_id='test-session-123')
+    assert json.loads(params['content']) == params['_content_dict']
+    assert params['_content_dict']['project_name'] == 'test-project'
 
-    params = {
-        'session_filter_mode': 'session_only',
-        # Missing session_id!
-    }
 
-    try:
+@pytest.mark.parametrize('params, should_raise, msg_fragment', ISOLATION_CASES,
+                         ids=['valid', 'invalid-mode', 'missing-session-id'])
+def test_ensure_isolation(integration, params, should_raise, msg_fragment):
+    """Test isolation enforcement with valid and invalid parameters."""
+    ctx = pytest.raises(ValueError, match=msg_fragment) if should_raise else nullcontext()
+    with ctx:
         integration.ensure_isolation(params)
-        assert False, "Should raise ValueError"
-    except ValueError as e:
-        assert 'session_id is required' in str(e)
 
 
-def test_store_analysis():
+def test_store_analysis(integration):
     """Test storing analysis results."""
-    integration = MemoryIntegration(session_id='test-session-123')
-
-    analysis_results = {
-        'detections': [
-            {'id': 'missing-readme', 'confidence': 'high'},
-            {'id': 'missing-gitignore', 'confidence': 'high'}
-        ],
-        'recommendations': [
-            {
-                'id': 'missing-readme',
-                'template': 'documentation/README',
-                'severity': 'high'
-            }
-        ],
-        'summary': {
-            'issues_found': 2,
-            'high_severity': 1,
-            'medium_severity': 1,
-            'low_severity': 0,
-            'total_patterns': 10
-        },
-        'project_types': ['python'],
-        'frameworks': ['django']
-    }
-
-    params = integration.store_analysis(analysis_results, 'test-project')
+    params = integration.store_analysis(_mutable(SAMPLE_ANALYSIS), 'test-project')
 
     # Verify isolation
-    assert params['session_filter_mode'] == 'session_only'
-    assert params['session_id'] == 'test-session-123'
+    expected_params = {
+        'session_filter_mode': 'session_only',
+        'session_id': 'test-session-123',
+    }
+    assert expected_params.items() <= params.items()
+    assert {'project-analysis', 'test-project'} <= set(params['tags'])
 
     # Verify content structure
-    content = json.loads(params['content'])
-    assert content['project_name'] == 'test-project'
-    assert content['patterns_detected'] == 2
-    assert content['issues_found'] == 2
-    assert len(content['recommendations']) == 1
-    assert content['project_type'] == ['python']
-    assert content['frameworks'] == ['django']
-    assert 'timestamp' in content
+    content = params['_content_dict']
+    assert json.loads(params['content']) == content
+    expected_content = {
+        'project_name': 'test-project',
+        'patterns_detected': 2,
+        'issues_found': 2,
+        'project_type': ['python'],
+        'frameworks': ['django'],
+        'timestamp': '2025-11-27T00:00:00',
+    }
+    assert expected_content.items() <= content.items()
     assert 'health_score' in content
-
-    # Verify tags
-    assert 'project-analysis' in params['tags']
-    assert 'test-project' in params['tags']
+    assert len(content['recommendations']) == 1
 
 
-def test_retrieve_analysis_history():
+def test_retrieve_analysis_history(integration):
     """Test retrieving analysis history."""
-    integration = MemoryIntegration(session_id='test-session-123')
-
     params = integration.retrieve_analysis_history('test-project')
 
     # Verify isolation
@@ -178,84 +185,22 @@ def test_retrieve_analysis_history():
     assert params['response_format'] == 'concise'
 
 
-def test_calculate_health_score():
+@pytest.mark.parametrize('summary, expected', HEALTH_CASES,
+                         ids=['perfect', 'one-high', 'multiple', 'floor-at-zero'])
+def test_calculate_health_score(integration, summary, expected):
     """Test health score calculation."""
-    integration = MemoryIntegration(session_id='test-session-123')
-
-    # Perfect project (no issues)
-    analysis = {
-        'summary': {
-            'total_patterns': 10,
-            'issues_found': 0,
-            'high_severity': 0,
-            'medium_severity': 0,
-            'low_severity': 0
-        }
-    }
-    health_score = integration._calculate_health_score(analysis)
-    assert health_score == 100
-
-    # Project with 1 high severity issue
-    analysis = {
-        'summary': {
-            'total_patterns': 10,
-            'issues_found': 1,
-            'high_severity': 1,
-            'medium_severity': 0,
-            'low_severity': 0
-        }
-    }
-    health_score = integration._calculate_health_score(analysis)
-    assert health_score == 70  # 100 - 10 (1/10*100) - 20 (1*20)
-
-    # Project with multiple issues
-    analysis = {
-        'summary': {
-            'total_patterns': 10,
-            'issues_found': 4,
-            'high_severity': 1,
-            'medium_severity': 2,
-            'low_severity': 1
-        }
-    }
-    health_score = integration._calculate_health_score(analysis)
-    # Calculation: 100 - 40 (4/10*100) - 20 (1*20) - 20 (2*10) = 20
-    assert health_score == 20
-
-    # Health score should never go below 0
-    analysis = {
-        'summary': {
-            'total_patterns': 10,
-            'issues_found': 10,
-            'high_severity': 10,
-            'medium_severity': 0,
-            'low_severity': 0
-        }
-    }
-    health_score = integration._calculate_health_score(analysis)
-    assert health_score == 0  # Capped at 0
+    assert integration._calculate_health_score({'summary': summary}) == expected
 
 
-def test_get_project_session_id_from_file():
+def test_get_project_session_id_from_file(fs, monkeypatch):
     """Test reading session ID from .claude/project-session-id file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create .claude directory and session ID file
-        claude_dir = Path(tmpdir) / '.claude'
-        claude_dir.mkdir()
-        session_file = claude_dir / 'project-session-id'
-        session_file.write_text('file-session-456')
-
-        # Change to temp directory
-        import os
-        old_cwd = os.getcwd()
-        try:
-            os.chdir(tmpdir)
-            integration = MemoryIntegration()
-            assert integration.session_id == 'file-session-456'
-        finally:
-            os.chdir(old_cwd)
+    # pyfakefs 'fs' fixture: the session file lives in an in-memory filesystem
+    fs.create_file('/proj/.claude/project-session-id', contents='file-session-456')
+
+    # Change to the fake project directory; restored by monkeypatch
+    monkeypatch.chdir('/proj')
+    assert MemoryIntegration().session_id == 'file-session-456'
 
 
 if __name__ == '__main__':
-    import pytest
     pytest.main([__file__, '-v'])